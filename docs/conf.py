@@ -1,3 +1,5 @@
+import os
+
 # Project settings.
 project = 'Goupil'
 copyright = 'Université Clermont Auvergne, CNRS/IN2P3, LPC'
@@ -40,6 +42,16 @@ intersphinx_mapping = {
     'numpy': ('https://numpy.org/doc/stable/', None)
 }
 
+# Offline builds (e.g. tests) use cached inventories, if any, instead of
+# fetching them over the network. The cache is filled with
+# `make intersphinx-cache`.
+if os.environ.get('SPHINX_OFFLINE'):
+    intersphinx_mapping = {
+        name: (url, f'_intersphinx_cache/{name}.inv')
+            for name, (url, _) in intersphinx_mapping.items()
+            if os.path.exists(f'_intersphinx_cache/{name}.inv')
+    }
+
 # Toctrees options.
 toc_object_entries = True
 toc_object_entries_show_parents = 'hide'
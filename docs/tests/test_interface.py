@@ -1,30 +1,32 @@
 import goupil
+import itertools
 import numpy
 import pytest
 
 
-def test_AtomicElement():
+ENERGIES = numpy.logspace(-2, 1, 31)
+
+
+@pytest.fixture(scope="module")
+def hydrogen():
+    """Hydrogen element."""
+
+    return goupil.AtomicElement("H")
+
+
+def test_AtomicElement(hydrogen):
     """Test usage of an AtomicElement."""
 
     # Check constructor from Z.
-    for z in range(1, 101):
+    for z in (1, 26, 100):
         element = goupil.AtomicElement(z)
         assert element.Z == z
         assert (element.A > 0.0) and (element.A != z)
 
-    # Check out of range values.
-    for z in (0, 119):
-        with pytest.raises(RuntimeError) as e:
-            element = goupil.AtomicElement(z)
-        assert str(e.value).startswith("bad atomic number")
-
-    # Check constructor from symbol.
-    for symbol in ("H", "C", "Fe", "U"):
-        element = goupil.AtomicElement(symbol)
-        assert element.symbol == symbol
-        assert isinstance(element.name, str)
-        assert isinstance(element.A, float)
-        assert isinstance(element.Z, int)
+    # Check bad argument type.
+    with pytest.raises(TypeError) as e:
+        goupil.AtomicElement(range(3))
+    assert str(e.value).startswith("bad atomic element")
 
     # Check unknown symbol.
     with pytest.raises(RuntimeError) as e:
@@ -32,29 +34,114 @@ def test_AtomicElement():
     assert str(e.value).startswith("no such atomic element")
 
     # Check comparison.
-    H0 = goupil.AtomicElement("H")
     H1 = goupil.AtomicElement("H")
-    assert H0 == H1
-
-    # Check immutable.
-    for attr in ("A", "name", "symbol", "Z"):
-        with pytest.raises(AttributeError) as e:
-            setattr(H0, attr, None)
-        assert "not writable" in str(e.value)
+    assert hydrogen == H1
 
     # Check electrons.
-    e = H0.electrons()
+    e = hydrogen.electrons()
     assert(isinstance(e, goupil.ElectronicStructure))
     assert(e.charge == 1.0)
 
     s = e.shells
-    del e
     assert(len(s) == 1)
     assert(s[0]["occupancy"] == 1.0)
     assert(abs(s[0]["energy"] - 13.6E-06) <= 1E-10)
 
+    # Check that shells are returned as a copy.
+    s.flags.writeable = True
+    s["occupancy"][0] = 0.0
+    assert(e.shells[0]["occupancy"] == 1.0)
+
+
+@pytest.mark.parametrize("z", (0, 119))
+def test_AtomicElement_bad_Z(z):
+    """Test out of range atomic numbers."""
+
+    with pytest.raises(RuntimeError) as e:
+        goupil.AtomicElement(z)
+    assert str(e.value).startswith("bad atomic number")
+
+
+@pytest.mark.parametrize("symbol", ("H", "C", "Fe", "U"))
+def test_AtomicElement_symbol(symbol):
+    """Test the construction of an AtomicElement from its symbol."""
+
+    element = goupil.AtomicElement(symbol)
+    assert element.symbol == symbol
+    assert isinstance(element.name, str)
+    assert isinstance(element.A, float)
+    assert isinstance(element.Z, int)
+
+
+@pytest.mark.parametrize("attr", ("A", "name", "symbol", "Z"))
+def test_AtomicElement_immutable(hydrogen, attr):
+    """Test that AtomicElement attributes are immutable."""
 
-def test_ComptonProcess():
+    with pytest.raises(AttributeError) as e:
+        setattr(hydrogen, attr, None)
+    assert "not writable" in str(e.value)
+
+
+def test_atomic_table():
+    """Test usage of the atomic_table function."""
+
+    table = goupil.atomic_table()
+    assert len(table) == 118
+    assert (table["Z"] == numpy.arange(1, 119)).all()
+    assert (table["A"] > 0.0).all() and (table["A"] != table["Z"]).all()
+
+    for z in (1, 26, 118):
+        element = goupil.AtomicElement(z)
+        assert element.A == table["A"][z - 1]
+        assert element.symbol == table["symbol"][z - 1]
+
+    # Check read-only.
+    with pytest.raises(ValueError):
+        table["A"][0] = 0.0
+
+    with pytest.raises(ValueError):
+        table.flags.writeable = True
+
+    assert goupil.atomic_table()["A"][0] == goupil.AtomicElement(1).A
+
+
+def test_elements():
+    """Test usage of the elements function."""
+
+    # Check instanciation from atomic numbers and symbols.
+    assert goupil.elements(1, 8) == goupil.elements("H", "O")
+    assert goupil.elements("H, O") == goupil.elements("H", "O")
+    assert goupil.elements("H") == goupil.AtomicElement("H")
+    assert goupil.elements() is None
+
+    # Check instanciation from a sequence of atomic numbers.
+    elements = goupil.elements(range(1, 101))
+    assert len(elements) == 100
+    zs = numpy.fromiter((element.Z for element in elements), dtype=int)
+    assert (zs == numpy.arange(1, 101)).all()
+
+    assert goupil.elements(range(0)) == ()
+    elements = goupil.elements(range(1, 2))
+    assert isinstance(elements, tuple)
+    assert elements == (goupil.AtomicElement(1),)
+
+    with pytest.raises(RuntimeError) as e:
+        goupil.elements([0])
+    assert str(e.value).startswith("bad atomic number")
+
+
+@pytest.fixture(scope="module")
+def material():
+    """Hydrogen material."""
+
+    H = goupil.elements("H")
+    return goupil.MaterialDefinition(
+        name = "Material",
+        mole_composition = ((1, H),)
+    )
+
+
+def test_ComptonProcess(material):
     """Test usage of a ComptonProcess."""
 
     # Check constructor.
@@ -64,24 +151,6 @@ def test_ComptonProcess():
     assert process.model == "Scattering Function"
     assert process.precision == 1.0
 
-    for method in ("Inverse Transform", "Rejection Sampling"):
-        for mode in ("Adjoint", "Direct", "Inverse"):
-            for model in ("Klein-Nishina", "Penelope", "Scattering Function"):
-                try:
-                    process = goupil.ComptonProcess(
-                        method=method,
-                        mode=mode,
-                        model=model
-                    )
-                except NotImplementedError as e:
-                    if str(e).startswith("bad sampling"):
-                        continue
-                else:
-                    assert process.method == method
-                    assert process.mode == mode
-                    assert process.model == model
-                    assert process.precision == 1.0
-
     process = goupil.ComptonProcess(precision=10.0)
     assert process.precision == 10.0
 
@@ -93,25 +162,71 @@ def test_ComptonProcess():
 
     # Check cross-section method.
     process = goupil.ComptonProcess()
-    H = goupil.elements("H")
-    material = goupil.MaterialDefinition(
-        name = "Material",
-        mole_composition = ((1, H),)
-    )
     assert process.cross_section(1.0, material) > 0.0
 
     process = goupil.ComptonProcess(model="Klein-Nishina")
-    energies = numpy.logspace(-2, 1, 31)
-    values = process.cross_section(energies, material)
-    assert values.shape == energies.shape
-    assert (numpy.diff(values) < 0.0).all()
+    values = process.cross_section(ENERGIES, material)
+    assert values.shape == ENERGIES.shape
+    numpy.testing.assert_array_less(numpy.diff(values), 0.0)
+
+
+def compton_configs():
+    """ComptonProcess configurations, with unsupported ones flagged."""
+
+    configs = []
+    for method, mode, model in itertools.product(
+        ("Inverse Transform", "Rejection Sampling"),
+        ("Adjoint", "Direct", "Inverse"),
+        ("Klein-Nishina", "Penelope", "Scattering Function")
+    ):
+        if model == "Penelope":
+            supported = (method == "Rejection Sampling") and (mode == "Direct")
+        else:
+            supported = (method == "Inverse Transform") or (mode != "Inverse")
+        if supported:
+            configs.append((method, mode, model))
+        else:
+            configs.append(pytest.param(method, mode, model,
+                marks=pytest.mark.xfail(raises=NotImplementedError, strict=False)
+            ))
+    return configs
+
+
+@pytest.mark.parametrize("method,mode,model", compton_configs())
+def test_ComptonProcess_config(method, mode, model):
+    """Test the configuration of a ComptonProcess."""
+
+    process = goupil.ComptonProcess(
+        method=method,
+        mode=mode,
+        model=model
+    )
+    assert process.method == method
+    assert process.mode == mode
+    assert process.model == model
+    assert process.precision == 1.0
+
 
+@pytest.fixture(scope="module")
+def H2O():
+    """Water material."""
 
-def test_MaterialDefinition():
+    return goupil.MaterialDefinition("H2O")
+
+
+@pytest.fixture(scope="module")
+def H2O_registry(H2O):
+    """Computed water tables (read-only)."""
+
+    registry = goupil.MaterialRegistry(H2O)
+    registry.compute()
+    return registry
+
+
+def test_MaterialDefinition(H2O):
     """Test usage of a MaterialDefinition."""
 
     # Check constructor.
-    H2O = goupil.MaterialDefinition("H2O")
     composition = H2O.mole_composition
     assert len(composition) == 2
     assert composition[0][0] == 2
@@ -157,13 +272,12 @@ def test_MaterialDefinition():
     assert(e.charge == 10.0)
 
     s = e.shells
-    del e
     assert(len(s) == 5)
     assert(s[0]["occupancy"] == 2.0)
     assert(abs(s[0]["energy"] - 13.6E-06) <= 1E-10)
 
 
-def test_MaterialRecord():
+def test_MaterialRecord(H2O, H2O_registry):
     """Test usage of a MaterialRecord."""
 
     # Check direct instanciation.
@@ -172,11 +286,7 @@ def test_MaterialRecord():
     assert str(e.value) == "No constructor defined"
 
     # Check attributes.
-    H2O = goupil.MaterialDefinition("H2O")
-    registry = goupil.MaterialRegistry(H2O)
-    registry.compute()
-
-    record = registry["H2O"]
+    record = H2O_registry["H2O"]
     assert(record.definition == H2O)
     assert(record.electrons == H2O.electrons())
 
@@ -208,10 +318,10 @@ def test_MaterialRecord():
     assert(table.material is record)
 
 
-def test_TransportEngine():
+@pytest.mark.timeout(10)
+def test_TransportEngine(H2O):
     """Test usage of a TransportEngine."""
 
-    H2O = goupil.MaterialDefinition("H2O")
     geometry = goupil.SimpleGeometry(H2O, 1.0)
     engine = goupil.TransportEngine(geometry)
 
@@ -225,22 +335,32 @@ def test_TransportEngine():
     assert(record.compton_cdf(mode="Adjoint") is not None)
 
 
-def test_TopographyMap():
+@pytest.fixture(scope="module")
+def zgrid():
+    """Seeded random elevation values."""
+
+    rng = numpy.random.default_rng(0)
+    return rng.random((201, 21))
+
+
+def test_TopographyMap(zgrid):
     """Test usage of a TopographyMap."""
 
+    x = numpy.linspace(-1, 1, 21)
+    y = numpy.linspace(-10, 10, 201)
+
     m0 = goupil.TopographyMap((-1, 1), (-10, 10), shape=(201, 21))
-    assert((m0.x == numpy.linspace(-1, 1, 21)).all())
-    assert((m0.y == numpy.linspace(-10, 10, 201)).all())
-    assert((m0.z == numpy.zeros((201, 21))).all())
-
-    z = numpy.random.rand(201, 21)
-    m1 = goupil.TopographyMap((-1, 1), (-10, 10), z)
-    assert((m1.x == numpy.linspace(-1, 1, 21)).all())
-    assert((m1.y == numpy.linspace(-10, 10, 201)).all())
-    assert((m1.z == z).all())
-
-    m0.z[:] = z
-    assert((m0.z == m1.z).all())
+    numpy.testing.assert_array_equal(m0.x, x)
+    numpy.testing.assert_array_equal(m0.y, y)
+    assert(not m0.z.any())
+
+    m1 = goupil.TopographyMap((-1, 1), (-10, 10), zgrid)
+    numpy.testing.assert_array_equal(m1.x, x)
+    numpy.testing.assert_array_equal(m1.y, y)
+    assert(numpy.array_equal(m1.z, zgrid))
+
+    m0.z[:] = zgrid
+    assert(numpy.array_equal(m0.z, m1.z))
 
     with pytest.raises(ValueError):
         m0.x[0] = 0.0
@@ -5,7 +5,7 @@ use pyo3::exceptions::PyKeyboardInterrupt;
 use pyo3::ffi;
 use pyo3::once_cell::GILOnceCell;
 use self::density::PyDensityGradient;
-use self::elements::{elements as elements_fun, PyAtomicElement};
+use self::elements::{atomic_table as atomic_table_fun, elements as elements_fun, PyAtomicElement};
 use self::geometry::{
     PyExternalGeometry,
     PyGeometrySector,
@@ -159,6 +159,7 @@ fn goupil(py: Python, module: &PyModule) -> PyResult<()> {
     module.add_class::<PyTransportStatus>()?;
 
     // Register function(s).
+    module.add_function(wrap_pyfunction!(atomic_table_fun, module)?)?;
     module.add_function(wrap_pyfunction!(elements_fun, module)?)?;
     module.add_function(wrap_pyfunction!(states_fun, module)?)?;
 
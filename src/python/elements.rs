@@ -1,13 +1,17 @@
 use anyhow::Result;
 use crate::numerics::float::Float;
 use crate::physics::elements::AtomicElement;
+use crate::physics::elements::data::ELEMENTS;
 use pyo3::prelude::*;
 use pyo3::class::basic::CompareOp;
 use pyo3::exceptions::PyNotImplementedError;
+use pyo3::once_cell::GILOnceCell;
 use pyo3::types::{PyBytes, PyTuple};
 use rmp_serde::{Deserializer, Serializer};
 use serde::{Deserialize, Serialize};
+use super::macros::type_error;
 use super::materials::PyElectronicStructure;
+use super::numpy::FLOAT_FORMAT;
 
 
 // ===============================================================================================
@@ -27,6 +31,9 @@ impl PyAtomicElement {
             Some(arg) => match arg {
                 AtomArg::Z(Z) => AtomicElement::from_Z(*Z)?,
                 AtomArg::Symbol(symbol) => AtomicElement::from_symbol(symbol)?,
+                AtomArg::Zs(_) => type_error!(
+                    "bad atomic element (expected an 'int' or a 'str', found a sequence)"
+                ),
             },
         };
         Ok(Self(element))
@@ -92,6 +99,7 @@ impl PyAtomicElement {
 enum AtomArg {
     Symbol(String),
     Z(i32),
+    Zs(Vec<i32>),
 }
 
 #[allow(non_snake_case)]
@@ -100,6 +108,7 @@ enum AtomArg {
 pub fn elements(py: Python, args: &PyTuple) -> Result<PyObject> {
     let args: Vec<AtomArg> = args.extract()?;
     let mut elements = Vec::<PyObject>::with_capacity(args.len());
+    let mut sequence = false;
     for arg in args.iter() {
         match arg {
             AtomArg::Symbol(symbols) => {
@@ -115,12 +124,45 @@ pub fn elements(py: Python, args: &PyTuple) -> Result<PyObject> {
                 let element = PyAtomicElement(AtomicElement::from_Z(*z)?);
                 elements.push(element.into_py(py));
             },
+            AtomArg::Zs(zs) => {
+                sequence = true;
+                elements.reserve(zs.len());
+                for z in zs.iter() {
+                    let element = PyAtomicElement(AtomicElement::from_Z(*z)?);
+                    elements.push(element.into_py(py));
+                }
+            },
         };
     }
-    let result = match elements.len() {
-        0 => py.None(),
-        1 => elements.pop().unwrap(),
-        _ => PyTuple::new(py, elements).into_py(py),
+    // Sequences of atomic numbers always result in a tuple, whatever their length.
+    let result = match (sequence, elements.len()) {
+        (true, _) => PyTuple::new(py, elements).into_py(py),
+        (false, 0) => py.None(),
+        (false, 1) => elements.pop().unwrap(),
+        (false, _) => PyTuple::new(py, elements).into_py(py),
     };
     Ok(result)
 }
+
+
+#[pyfunction]
+pub fn atomic_table(py: Python) -> Result<PyObject> {
+    static TABLE: GILOnceCell<PyObject> = GILOnceCell::new();
+    let table = TABLE.get_or_try_init(py, || {
+        let records: Vec<_> = ELEMENTS
+            .iter()
+            .map(|element| (element.Z, element.A, element.symbol))
+            .collect();
+        let dtype = [("Z", "i4"), ("A", FLOAT_FORMAT), ("symbol", "U2")];
+        let table = PyModule::import(py, "numpy")?
+            .getattr("array")?
+            .call1((records, dtype))?;
+        table
+            .getattr("flags")?
+            .setattr("writeable", false)?;
+        Ok::<PyObject, PyErr>(table.into_py(py))
+    })?;
+    // Return a view of the cached table, such that it cannot be made writeable.
+    let view = table.call_method0(py, "view")?;
+    Ok(view)
+}
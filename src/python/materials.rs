@@ -1,11 +1,11 @@
-use anyhow::{anyhow, Error, Result};
+use anyhow::{anyhow, Result};
 use crate::numerics::{
     float::Float,
     grids::Grid,
 };
 use crate::physics::elements::AtomicElement;
 use crate::physics::materials::{
-    electronic::ElectronicStructure,
+    electronic::{ElectronicShell, ElectronicStructure},
     MaterialDefinition,
     MaterialRecord,
     MaterialRegistry,
@@ -28,7 +28,6 @@ use crate::transport::{
 use pyo3::{
     prelude::*,
     exceptions::PyKeyError,
-    sync::GILOnceCell,
     types::{PyBytes, PyTuple},
 };
 use rmp_serde::{Deserializer, Serializer};
@@ -766,7 +765,6 @@ impl PyMaterialRecord {
 pub struct PyElectronicStructure {
     electrons: ElectronicStructure,
     writable: bool,
-    shells: GILOnceCell<PyObject>,
 }
 
 impl PyElectronicStructure {
@@ -774,7 +772,6 @@ impl PyElectronicStructure {
         Ok(Self {
             electrons,
             writable,
-            shells: GILOnceCell::new(),
         })
     }
 }
@@ -787,24 +784,19 @@ impl PyElectronicStructure {
     }
 
     #[getter]
-    fn get_shells(slf: &PyCell<Self>, py: Python) -> Result<PyObject> {
-        let obj = slf.borrow();
-        let shells = obj.shells.get_or_try_init(py, || {
-            let flags = if obj.writable {
-                PyArrayFlags::ReadWrite
-            } else {
-                PyArrayFlags::ReadOnly
-            };
-            let shells: &PyAny = PyArray::from_data(
-                py,
-                &obj.electrons,
-                slf,
-                flags,
-                None,
-            )?;
-            Ok::<Py<PyAny>, Error>(shells.into())
-        })?;
-        Ok(shells.clone_ref(py))
+    fn get_shells(&self, py: Python) -> Result<PyObject> {
+        // Return a copy of the shells data, such that modifying the returned array does not
+        // alter this object.
+        let shells = PyArray::<ElectronicShell>::from_iter(
+            py,
+            &[self.electrons.len()],
+            self.electrons.iter().copied(),
+        )?;
+        if !self.writable {
+            shells.readonly();
+        }
+        let shells: &PyAny = shells;
+        Ok(shells.into())
     }
 
     fn __eq__(&self, other: &Self) -> bool {